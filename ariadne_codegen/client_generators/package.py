@@ -1,4 +1,7 @@
 import ast
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 
@@ -84,6 +87,7 @@ class PackageGenerator:
         custom_scalars: Optional[Dict[str, ScalarData]] = None,
         plugin_manager: Optional[PluginManager] = None,
         enable_custom_operations: bool = False,
+        parallel_formatting: bool = False,
     ) -> None:
         self.package_path = Path(target_path) / package_name
 
@@ -139,6 +143,8 @@ class PackageGenerator:
         self._unpacked_fragments: Set[str] = set()
         self._used_enums: List[str] = []
 
+        self.parallel_formatting = parallel_formatting
+
         self.enable_custom_operations = enable_custom_operations
         if self.enable_custom_operations:
             self.files_to_include.append(self.base_schema_root_file_path)
@@ -317,14 +323,27 @@ class PackageGenerator:
         )
 
     def _generate_result_types(self):
-        for file_name, module in self._result_types_files.items():
+        codes = self._modules_to_str(list(self._result_types_files.values()))
+        for file_name, code in zip(self._result_types_files, codes):
             file_path = self.package_path / file_name
-            code = self._add_comments_to_code(ast_to_str(module), self.queries_source)
+            code = self._add_comments_to_code(code, self.queries_source)
             if self.plugin_manager:
                 code = self.plugin_manager.generate_result_types_code(code)
             file_path.write_text(code)
             self._generated_files.append(file_path.name)
 
+    def _modules_to_str(self, modules: List[ast.Module]) -> List[str]:
+        """Convert modules into strings, in worker processes if enabled."""
+        workers = min(len(modules), os.cpu_count() or 1)
+        if self.parallel_formatting and workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    return list(executor.map(ast_to_str, modules))
+            except (OSError, BrokenProcessPool):
+                pass
+
+        return [ast_to_str(module) for module in modules]
+
     def _generate_fragments(self):
         if not set(self.fragments_definitions.keys()).difference(
             self._unpacked_fragments
@@ -533,4 +552,5 @@ def get_package_generator(
         custom_scalars=settings.scalars,
         plugin_manager=plugin_manager,
         enable_custom_operations=settings.enable_custom_operations,
+        parallel_formatting=settings.parallel_formatting,
     )
@@ -1,6 +1,7 @@
 import ast
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, cast
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Tuple, Type, cast
 
 from graphql import (
     DirectiveNode,
@@ -11,6 +12,7 @@ from graphql import (
     GraphQLEnumType,
     GraphQLInterfaceType,
     GraphQLList,
+    GraphQLNamedType,
     GraphQLNonNull,
     GraphQLObjectType,
     GraphQLScalarType,
@@ -49,17 +51,24 @@ from .constants import (
 from .scalars import ScalarData, generate_result_scalar_annotation
 from .types import Annotation, AnnotationSlice, CodegenResultFieldType
 
+NULLABLE_DIRECTIVES = frozenset({INCLUDE_DIRECTIVE_NAME, SKIP_DIRECTIVE_NAME})
+NO_DIRECTIVES: Tuple[DirectiveNode, ...] = ()
+NO_CUSTOM_SCALARS: Mapping[str, ScalarData] = MappingProxyType({})
+NO_FRAGMENTS_DEFINITIONS: Mapping[str, FragmentDefinitionNode] = MappingProxyType({})
+
 
 @dataclass
 class Definitions:
     schema: GraphQLSchema
     field_node: FieldNode
-    custom_scalars: Dict[str, ScalarData]
-    fragments_definitions: Dict[str, FragmentDefinitionNode]
+    custom_scalars: Mapping[str, ScalarData]
+    fragments_definitions: Mapping[str, FragmentDefinitionNode]
 
 
 @dataclass
 class RelatedClassData:
+    __slots__ = ("class_name", "type_name")
+
     class_name: str
     type_name: str
 
@@ -80,17 +89,19 @@ def parse_operation_field(
     directives: Optional[Tuple[DirectiveNode, ...]] = None,
     class_name: str = "",
     typename_values: Optional[List[str]] = None,
-    custom_scalars: Optional[Dict[str, ScalarData]] = None,
-    fragments_definitions: Optional[Dict[str, FragmentDefinitionNode]] = None,
+    custom_scalars: Optional[Mapping[str, ScalarData]] = None,
+    fragments_definitions: Optional[Mapping[str, FragmentDefinitionNode]] = None,
 ) -> Tuple[Annotation, Optional[ast.Constant], FieldContext]:
     default_value: Optional[ast.Constant] = None
     context = FieldContext(
         definitions=Definitions(
             schema=schema,
             field_node=field,
-            custom_scalars=custom_scalars if custom_scalars else {},
+            custom_scalars=custom_scalars if custom_scalars else NO_CUSTOM_SCALARS,
             fragments_definitions=(
-                fragments_definitions if fragments_definitions else {}
+                fragments_definitions
+                if fragments_definitions
+                else NO_FRAGMENTS_DEFINITIONS
             ),
         )
     )
@@ -110,7 +121,9 @@ def parse_operation_field(
             cast(AnnotationSlice, annotation.slice)
         )
     annotation, default_value = parse_directives(
-        annotation=annotation, directives=directives if directives else tuple()
+        annotation=annotation,
+        nullable=not isinstance(type_, GraphQLNonNull),
+        directives=directives if directives else NO_DIRECTIVES,
     )
 
     return annotation, default_value, context
@@ -122,7 +135,6 @@ def generate_typename_annotation(typename_values: List[str]) -> ast.Subscript:
     return generate_subscript(value=generate_name(LITERAL), slice_=slice_)
 
 
-# pylint: disable=too-many-return-statements, too-many-branches
 def parse_operation_field_type(
     type_: CodegenResultFieldType,
     nullable: bool,
@@ -131,65 +143,91 @@ def parse_operation_field_type(
     add_type_name: bool,
 ) -> Annotation:
     """Parse graphql type and return generated annotation."""
-    if isinstance(type_, GraphQLScalarType):
-        return parse_scalar_type(type_=type_, nullable=nullable, context=context)
-
-    if isinstance(type_, GraphQLInterfaceType):
-        return parse_interface_type(
-            type_=type_,
-            nullable=nullable,
-            context=context,
-            class_name=class_name,
-            add_type_name=add_type_name,
-        )
-
-    if isinstance(type_, GraphQLObjectType):
-        return parse_object_type(
-            type_=type_,
-            nullable=nullable,
+    named_type, non_null_levels = get_field_type_shape(type_)
+    if len(non_null_levels) == 1:
+        # Not a list, only non null wrapper has to be applied.
+        return parse_named_type(
+            type_=named_type,
+            nullable=nullable and not non_null_levels[0],
             context=context,
             class_name=class_name,
-            add_type_name=add_type_name,
+            add_type_name=add_type_name and named_type is type_,
         )
 
-    if isinstance(type_, GraphQLEnumType):
-        return parse_enum_type(type_=type_, nullable=nullable, context=context)
-
-    if isinstance(type_, GraphQLUnionType):
-        return parse_union_type(
-            type_=type_, nullable=nullable, context=context, class_name=class_name
+    levels_nullable = [
+        not non_null and (nullable if level == 0 else True)
+        for level, non_null in enumerate(non_null_levels)
+    ]
+    annotation = parse_named_type(
+        type_=named_type,
+        nullable=levels_nullable.pop(),
+        context=context,
+        class_name=class_name,
+        add_type_name=False,
+    )
+    while levels_nullable:
+        annotation = generate_list_annotation(
+            slice_=annotation, nullable=levels_nullable.pop()
         )
+    return annotation
 
-    if isinstance(type_, GraphQLList):
-        return parse_list_type(
-            type_=type_, nullable=nullable, context=context, class_name=class_name
-        )
 
-    if isinstance(type_, GraphQLNonNull):
-        return parse_operation_field_type(
-            type_=type_.of_type,
-            context=context,
-            nullable=False,
-            class_name=class_name,
-            add_type_name=False,
+def get_field_type_shape(
+    type_: CodegenResultFieldType,
+) -> Tuple[GraphQLNamedType, Tuple[bool, ...]]:
+    """Return named type wrapped by given type and non null flag of every level.
+
+    Levels are ordered from the outermost one, every list adds one level.
+    """
+    non_null_levels: List[bool] = []
+    non_null = False
+    while True:
+        if isinstance(type_, GraphQLNonNull):
+            non_null = True
+        elif isinstance(type_, GraphQLList):
+            non_null_levels.append(non_null)
+            non_null = False
+        else:
+            break
+        type_ = type_.of_type
+    non_null_levels.append(non_null)
+
+    return type_, tuple(non_null_levels)
+
+
+def parse_named_type(
+    type_: GraphQLNamedType,
+    nullable: bool,
+    context: FieldContext,
+    class_name: str,
+    add_type_name: bool,
+) -> Annotation:
+    parser = NAMED_TYPES_PARSERS.get(type(type_))
+    if parser is None:
+        parser = next(
+            (p for t, p in NAMED_TYPES_PARSERS.items() if isinstance(type_, t)), None
         )
+    if parser is None:
+        raise ParsingError("Invalid field type.")
 
-    raise ParsingError("Invalid field type.")
+    return parser(type_, nullable, context, class_name, add_type_name)
 
 
 def parse_scalar_type(
     type_: GraphQLScalarType,
     nullable: bool,
     context: FieldContext,
+    _class_name: str = "",
+    _add_type_name: bool = False,
 ) -> Annotation:
-    if type_.name in SIMPLE_TYPE_MAP:
-        return generate_annotation_name(SIMPLE_TYPE_MAP[type_.name], nullable)
+    simple_type = SIMPLE_TYPE_MAP.get(type_.name)
+    if simple_type is not None:
+        return generate_annotation_name(simple_type, nullable)
 
-    if type_.name in context.definitions.custom_scalars:
+    scalar_data = context.definitions.custom_scalars.get(type_.name)
+    if scalar_data is not None:
         context.custom_scalars.append(type_.name)
-        annotation = generate_result_scalar_annotation(
-            context.definitions.custom_scalars[type_.name]
-        )
+        annotation = generate_result_scalar_annotation(scalar_data)
         if nullable:
             annotation = generate_nullable_annotation(annotation)
         return annotation
@@ -216,30 +254,20 @@ def parse_interface_type(
     )
     context.abstract_type = True
     if inline_fragments or fragments_on_subtypes:
-        types: List[ast.expr] = [
-            generate_annotation_name('"' + class_name + type_.name + '"', False)
-        ]
-        context.related_classes.append(
-            RelatedClassData(class_name=class_name + type_.name, type_name=type_.name)
-        )
-        fragments_types_names = sorted(
+        types_names = [type_.name] + sorted(
             {
                 f.type_condition.name.value
                 for f in inline_fragments + fragments_on_subtypes
             }
         )
-        for fragment_type_name in fragments_types_names:
-            types.append(
-                generate_annotation_name(
-                    '"' + class_name + fragment_type_name + '"', False
-                )
-            )
-            context.related_classes.append(
-                RelatedClassData(
-                    class_name=class_name + fragment_type_name,
-                    type_name=fragment_type_name,
-                )
-            )
+        context.related_classes.extend(
+            RelatedClassData(class_name=class_name + name, type_name=name)
+            for name in types_names
+        )
+        types: List[ast.expr] = [
+            generate_annotation_name('"' + class_name + name + '"', False)
+            for name in types_names
+        ]
         return generate_union_annotation(types=types, nullable=nullable)
 
     name = class_name + type_.name if add_type_name else class_name
@@ -264,7 +292,11 @@ def parse_object_type(
 
 
 def parse_enum_type(
-    type_: GraphQLEnumType, nullable: bool, context: FieldContext
+    type_: GraphQLEnumType,
+    nullable: bool,
+    context: FieldContext,
+    _class_name: str = "",
+    _add_type_name: bool = False,
 ) -> Annotation:
     context.enums.append(type_.name)
     return generate_annotation_name(type_.name, nullable)
@@ -275,13 +307,15 @@ def parse_union_type(
     nullable: bool,
     context: FieldContext,
     class_name: str,
+    _add_type_name: bool = False,
 ) -> Annotation:
     context.abstract_type = True
+    # Union members are always object types, no need to unwrap or dispatch them.
     sub_annotations: List[ast.expr] = [
-        parse_operation_field_type(
+        parse_object_type(
             type_=subtype,
-            context=context,
             nullable=False,
+            context=context,
             class_name=class_name,
             add_type_name=True,
         )
@@ -291,25 +325,23 @@ def parse_union_type(
     return generate_union_annotation(sub_annotations, nullable)
 
 
-def parse_list_type(
-    type_: GraphQLList,
-    nullable: bool,
-    context: FieldContext,
-    class_name: str,
-) -> Annotation:
-    slice_ = parse_operation_field_type(
-        type_=cast(CodegenResultFieldType, type_.of_type),
-        context=context,
-        nullable=True,
-        class_name=class_name,
-        add_type_name=False,
-    )
-    return generate_list_annotation(slice_=slice_, nullable=nullable)
+NamedTypeParser = Callable[
+    [GraphQLNamedType, bool, FieldContext, str, bool], Annotation
+]
+
+# Casts are evaluated once at import, calls through the table stay type checked.
+NAMED_TYPES_PARSERS: Dict[Type[GraphQLNamedType], NamedTypeParser] = {
+    GraphQLScalarType: cast(NamedTypeParser, parse_scalar_type),
+    GraphQLInterfaceType: cast(NamedTypeParser, parse_interface_type),
+    GraphQLObjectType: cast(NamedTypeParser, parse_object_type),
+    GraphQLEnumType: cast(NamedTypeParser, parse_enum_type),
+    GraphQLUnionType: cast(NamedTypeParser, parse_union_type),
+}
 
 
 def get_inline_fragments_from_selection_set(
     selection_set: Optional[SelectionSetNode],
-    fragments_definitions: Optional[Dict[str, FragmentDefinitionNode]],
+    fragments_definitions: Optional[Mapping[str, FragmentDefinitionNode]],
 ) -> List[InlineFragmentNode]:
     if not selection_set:
         return []
@@ -334,7 +366,7 @@ def get_inline_fragments_from_selection_set(
 def get_fragments_on_subtype(
     schema: GraphQLSchema,
     selection_set: Optional[SelectionSetNode],
-    fragments_definitions: Optional[Dict[str, FragmentDefinitionNode]],
+    fragments_definitions: Optional[Mapping[str, FragmentDefinitionNode]],
     root_type: str,
 ) -> List[FragmentDefinitionNode]:
     root_type_def = schema.get_type(root_type)
@@ -394,13 +426,10 @@ def annotate_nested_unions(annotation: AnnotationSlice) -> AnnotationSlice:
 
 
 def parse_directives(
-    annotation: Annotation, directives: Tuple[DirectiveNode, ...]
+    annotation: Annotation, nullable: bool, directives: Tuple[DirectiveNode, ...]
 ) -> Tuple[Annotation, Optional[ast.Constant]]:
-    nullable_directives = (INCLUDE_DIRECTIVE_NAME, SKIP_DIRECTIVE_NAME)
-    directives_names = [d.name.value for d in directives]
-
-    if any(n in nullable_directives for n in directives_names):
-        if not is_nullable(annotation):
+    if directives and any(d.name.value in NULLABLE_DIRECTIVES for d in directives):
+        if not nullable:
             annotation = generate_nullable_annotation(annotation)
         return annotation, generate_constant(None)
 
@@ -1,5 +1,6 @@
 import ast
 import sys
+from copy import deepcopy
 from typing import Any, Dict, List, Optional, Union, cast
 
 from graphql import (
@@ -49,6 +50,20 @@ def generate_annotation_name(
     return result if not nullable else generate_nullable_annotation(result)
 
 
+def clone_annotation(annotation: ast.expr) -> ast.expr:
+    """Copy annotation, building names, subscripts and tuples directly."""
+    if isinstance(annotation, ast.Name):
+        return ast.Name(id=annotation.id)
+    if isinstance(annotation, ast.Subscript):
+        return ast.Subscript(
+            value=clone_annotation(annotation.value),
+            slice=clone_annotation(annotation.slice),
+        )
+    if isinstance(annotation, ast.Tuple):
+        return ast.Tuple(elts=[clone_annotation(elt) for elt in annotation.elts])
+    return deepcopy(annotation)
+
+
 def generate_list_annotation(
     slice_: Union[ast.Name, ast.Subscript], nullable: bool = True
 ) -> ast.Subscript:
@@ -35,7 +35,6 @@ This plugin can be enabled in the settings:
 """
 
 import ast
-from copy import deepcopy
 from typing import Dict, List, Optional, Union
 
 from graphql import (
@@ -46,6 +45,7 @@ from graphql import (
 )
 
 from ..codegen import (
+    clone_annotation,
     generate_async_for,
     generate_attribute,
     generate_expr,
@@ -362,10 +362,10 @@ def _return_or_yield_node_and_class(
     # require several iterations if the return type is something like
     # Optional[List[Any]]
     #
-    # We make a deepcopy because we need to keep the quoted annotations for the
+    # We make a copy because we need to keep the quoted annotations for the
     # fields in the query classes but we want to have it unquoted in the client
     # method where we import the actual types.
-    annotations = deepcopy(single_field.annotation)
+    annotations = clone_annotation(single_field.annotation)
     return_node, return_classes = _update_node(annotations)
 
     return return_node, return_classes, single_field.target.id
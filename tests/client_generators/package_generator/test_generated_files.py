@@ -259,6 +259,154 @@ def test_generate_creates_multiple_query_types_files(
     assert query2_file_path.is_file()
 
 
+def test_generate_creates_the_same_query_types_files_when_formatting_in_parallel(
+    mocker, tmp_path, schema, async_base_client_import
+):
+    mocker.patch(
+        "ariadne_codegen.client_generators.package.os.cpu_count", return_value=2
+    )
+    query_str = """
+    query CustomQuery1 {
+        query2 {
+            id
+        }
+    }
+
+    query CustomQuery2 {
+        query2 {
+            id
+        }
+    }
+    """
+    files_contents = []
+    for parallel_formatting in (False, True):
+        target_path = tmp_path / str(parallel_formatting)
+        target_path.mkdir()
+        generator = PackageGenerator(
+            package_name="test_graphql_client",
+            target_path=target_path.as_posix(),
+            schema=schema,
+            init_generator=InitFileGenerator(),
+            client_generator=ClientGenerator(
+                base_client_import=async_base_client_import,
+                arguments_generator=ArgumentsGenerator(schema=schema),
+            ),
+            enums_generator=EnumsGenerator(schema=schema),
+            input_types_generator=InputTypesGenerator(schema=schema),
+            fragments_generator=FragmentsGenerator(
+                schema=schema, fragments_definitions={}
+            ),
+            parallel_formatting=parallel_formatting,
+        )
+        for definition in parse(query_str).definitions:
+            generator.add_operation(definition)
+        generator.generate()
+
+        package_path = target_path / "test_graphql_client"
+        files_contents.append(
+            [
+                (package_path / file_name).read_text()
+                for file_name in ("custom_query_1.py", "custom_query_2.py")
+            ]
+        )
+
+    assert files_contents[0] == files_contents[1]
+
+
+def test_generate_formats_query_types_files_serially_if_processes_cannot_start(
+    mocker, tmp_path, schema, async_base_client_import
+):
+    mocker.patch(
+        "ariadne_codegen.client_generators.package.os.cpu_count", return_value=2
+    )
+    mocker.patch(
+        "ariadne_codegen.client_generators.package.ProcessPoolExecutor",
+        side_effect=OSError,
+    )
+    query_str = """
+    query CustomQuery1 {
+        query2 {
+            id
+        }
+    }
+
+    query CustomQuery2 {
+        query2 {
+            id
+        }
+    }
+    """
+    package_name = "test_graphql_client"
+    generator = PackageGenerator(
+        package_name=package_name,
+        target_path=tmp_path.as_posix(),
+        schema=schema,
+        init_generator=InitFileGenerator(),
+        client_generator=ClientGenerator(
+            base_client_import=async_base_client_import,
+            arguments_generator=ArgumentsGenerator(schema=schema),
+        ),
+        enums_generator=EnumsGenerator(schema=schema),
+        input_types_generator=InputTypesGenerator(schema=schema),
+        fragments_generator=FragmentsGenerator(schema=schema, fragments_definitions={}),
+        parallel_formatting=True,
+    )
+    for definition in parse(query_str).definitions:
+        generator.add_operation(definition)
+    generator.generate()
+
+    package_path = tmp_path / package_name
+    assert (package_path / "custom_query_1.py").is_file()
+    assert (package_path / "custom_query_2.py").is_file()
+
+
+def test_generate_formats_query_types_files_serially_on_single_cpu(
+    mocker, tmp_path, schema, async_base_client_import
+):
+    mocker.patch(
+        "ariadne_codegen.client_generators.package.os.cpu_count", return_value=1
+    )
+    mocked_executor = mocker.patch(
+        "ariadne_codegen.client_generators.package.ProcessPoolExecutor"
+    )
+    query_str = """
+    query CustomQuery1 {
+        query2 {
+            id
+        }
+    }
+
+    query CustomQuery2 {
+        query2 {
+            id
+        }
+    }
+    """
+    package_name = "test_graphql_client"
+    generator = PackageGenerator(
+        package_name=package_name,
+        target_path=tmp_path.as_posix(),
+        schema=schema,
+        init_generator=InitFileGenerator(),
+        client_generator=ClientGenerator(
+            base_client_import=async_base_client_import,
+            arguments_generator=ArgumentsGenerator(schema=schema),
+        ),
+        enums_generator=EnumsGenerator(schema=schema),
+        input_types_generator=InputTypesGenerator(schema=schema),
+        fragments_generator=FragmentsGenerator(schema=schema, fragments_definitions={}),
+        parallel_formatting=True,
+    )
+    for definition in parse(query_str).definitions:
+        generator.add_operation(definition)
+    generator.generate()
+
+    assert not mocked_executor.called
+    package_path = tmp_path / package_name
+    assert (package_path / "custom_query_1.py").is_file()
+    assert (package_path / "custom_query_2.py").is_file()
+
+
 def test_generate_copies_base_client_file(tmp_path, schema, async_base_client_import):
     base_client_file_content = """
     class TestBaseClient:
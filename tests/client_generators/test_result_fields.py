@@ -36,15 +36,16 @@ from ariadne_codegen.client_generators.constants import (
     UNION,
 )
 from ariadne_codegen.client_generators.result_fields import (
+    NAMED_TYPES_PARSERS,
     Definitions,
     FieldContext,
     RelatedClassData,
     annotate_nested_unions,
+    get_field_type_shape,
     is_nullable,
     is_union,
     parse_enum_type,
     parse_interface_type,
-    parse_list_type,
     parse_object_type,
     parse_operation_field,
     parse_operation_field_type,
@@ -79,6 +80,19 @@ from ..utils import compare_ast
             GraphQLScalarType("String"),
             ast.Subscript(value=ast.Name(id=OPTIONAL), slice=ast.Name(id="str")),
         ),
+        (
+            INCLUDE_DIRECTIVE_NAME,
+            GraphQLNonNull(GraphQLList(GraphQLScalarType("String"))),
+            ast.Subscript(
+                value=ast.Name(id=OPTIONAL),
+                slice=ast.Subscript(
+                    value=ast.Name(id=LIST),
+                    slice=ast.Subscript(
+                        value=ast.Name(id=OPTIONAL), slice=ast.Name(id="str")
+                    ),
+                ),
+            ),
+        ),
     ],
 )
 def test_parse_operation_field_returns_optional_annotation_if_given_nullable_directive(
@@ -94,6 +108,21 @@ def test_parse_operation_field_returns_optional_annotation_if_given_nullable_dir
     assert compare_ast(annotation, expected_annotation)
 
 
+def test_parse_operation_field_accepts_none_for_optional_arguments():
+    annotation, default_value, context = parse_operation_field(
+        schema=GraphQLSchema(),
+        field=FieldNode(name=NameNode(value="field")),
+        type_=GraphQLNonNull(GraphQLScalarType("String")),
+        directives=None,
+        custom_scalars=None,
+        fragments_definitions=None,
+    )
+
+    assert compare_ast(annotation, ast.Name(id="str"))
+    assert default_value is None
+    assert not context.custom_scalars
+
+
 def test_parse_operation_field_returns_typename_annotation_with_multiple_values():
     expected_annotation = ast.Subscript(
         value=ast.Name(id=LITERAL),
@@ -170,14 +199,14 @@ def test_parse_operation_field_returns_annotation_with_annotated_nested_unions()
 
 
 @pytest.mark.parametrize(
-    "type_, expected_method_name",
+    "type_, expected_parsed_type",
     [
-        (GraphQLScalarType("String"), "parse_scalar_type"),
-        (GraphQLInterfaceType("TestInterface", fields={}), "parse_interface_type"),
-        (GraphQLObjectType("TestType", fields={}), "parse_object_type"),
+        (GraphQLScalarType("String"), GraphQLScalarType),
+        (GraphQLInterfaceType("TestInterface", fields={}), GraphQLInterfaceType),
+        (GraphQLObjectType("TestType", fields={}), GraphQLObjectType),
         (
             GraphQLEnumType("TestEnum", values=cast(GraphQLEnumValueMap, {})),
-            "parse_enum_type",
+            GraphQLEnumType,
         ),
         (
             GraphQLUnionType(
@@ -187,16 +216,20 @@ def test_parse_operation_field_returns_annotation_with_annotated_nested_unions()
                     GraphQLObjectType("TestTypeB", fields={}),
                 ],
             ),
-            "parse_union_type",
+            GraphQLUnionType,
         ),
         (
             GraphQLList(type_=GraphQLObjectType("TestType", fields={})),
-            "parse_list_type",
+            GraphQLObjectType,
+        ),
+        (
+            GraphQLNonNull(GraphQLList(GraphQLNonNull(GraphQLScalarType("String")))),
+            GraphQLScalarType,
         ),
     ],
 )
 def test_parse_operation_field_type_calls_correct_method_for_type(
-    mocker, type_, expected_method_name
+    mocker, type_, expected_parsed_type
 ):
     context = FieldContext(
         definitions=Definitions(
@@ -206,10 +239,8 @@ def test_parse_operation_field_type_calls_correct_method_for_type(
             fragments_definitions={},
         )
     )
-    mocked_method = mocker.patch(
-        f"ariadne_codegen.client_generators.result_fields.{expected_method_name}",
-        return_value=ast.Name(id="placeholder"),
-    )
+    mocked_method = mocker.Mock(return_value=ast.Name(id="placeholder"))
+    mocker.patch.dict(NAMED_TYPES_PARSERS, {expected_parsed_type: mocked_method})
 
     parse_operation_field_type(
         type_=type_,
@@ -222,6 +253,122 @@ def test_parse_operation_field_type_calls_correct_method_for_type(
     assert mocked_method.called
 
 
+def test_parse_operation_field_type_calls_correct_method_for_subclassed_type(mocker):
+    class CustomObjectType(GraphQLObjectType):
+        pass
+
+    context = FieldContext(
+        definitions=Definitions(
+            schema=GraphQLSchema(),
+            field_node=FieldNode(),
+            custom_scalars={},
+            fragments_definitions={},
+        )
+    )
+    mocked_method = mocker.Mock(return_value=ast.Name(id="placeholder"))
+    mocker.patch.dict(NAMED_TYPES_PARSERS, {GraphQLObjectType: mocked_method})
+
+    parse_operation_field_type(
+        type_=CustomObjectType("TestType", fields={}),
+        nullable=True,
+        context=context,
+        class_name="",
+        add_type_name=False,
+    )
+
+    assert mocked_method.called
+
+
+@pytest.mark.parametrize(
+    "type_, expected_shape",
+    [
+        (GraphQLScalarType("String"), (False,)),
+        (GraphQLNonNull(GraphQLScalarType("String")), (True,)),
+        (GraphQLList(GraphQLScalarType("String")), (False, False)),
+        (
+            GraphQLNonNull(GraphQLList(GraphQLNonNull(GraphQLScalarType("String")))),
+            (True, True),
+        ),
+        (
+            GraphQLList(GraphQLNonNull(GraphQLList(GraphQLScalarType("String")))),
+            (False, True, False),
+        ),
+    ],
+)
+def test_get_field_type_shape_returns_named_type_and_non_null_levels(
+    type_, expected_shape
+):
+    named_type, non_null_levels = get_field_type_shape(type_)
+
+    assert isinstance(named_type, GraphQLScalarType)
+    assert named_type.name == "String"
+    assert non_null_levels == expected_shape
+
+
+@pytest.mark.parametrize(
+    "type_, nullable, expected_annotation",
+    [
+        (
+            GraphQLNonNull(GraphQLScalarType("String")),
+            True,
+            ast.Name(id="str"),
+        ),
+        (
+            GraphQLList(GraphQLScalarType("String")),
+            False,
+            ast.Subscript(
+                value=ast.Name(id=LIST),
+                slice=ast.Subscript(
+                    value=ast.Name(id=OPTIONAL), slice=ast.Name(id="str")
+                ),
+            ),
+        ),
+        (
+            GraphQLList(GraphQLNonNull(GraphQLList(GraphQLScalarType("String")))),
+            True,
+            ast.Subscript(
+                value=ast.Name(id=OPTIONAL),
+                slice=ast.Subscript(
+                    value=ast.Name(id=LIST),
+                    slice=ast.Subscript(
+                        value=ast.Name(id=LIST),
+                        slice=ast.Subscript(
+                            value=ast.Name(id=OPTIONAL), slice=ast.Name(id="str")
+                        ),
+                    ),
+                ),
+            ),
+        ),
+        (
+            GraphQLNonNull(GraphQLList(GraphQLNonNull(GraphQLScalarType("String")))),
+            True,
+            ast.Subscript(value=ast.Name(id=LIST), slice=ast.Name(id="str")),
+        ),
+    ],
+)
+def test_parse_operation_field_type_returns_annotation_for_wrapped_types(
+    type_, nullable, expected_annotation
+):
+    context = FieldContext(
+        definitions=Definitions(
+            schema=GraphQLSchema(),
+            field_node=FieldNode(),
+            custom_scalars={},
+            fragments_definitions={},
+        )
+    )
+
+    annotation = parse_operation_field_type(
+        type_=type_,
+        nullable=nullable,
+        context=context,
+        class_name="",
+        add_type_name=False,
+    )
+
+    assert compare_ast(annotation, expected_annotation)
+
+
 @pytest.mark.parametrize(
     "type_, nullable, expected_annotation",
     [
@@ -635,11 +782,12 @@ def test_parse_operation_field_type_returns_annotation_for_list(
             fragments_definitions={},
         )
     )
-    annotation = parse_list_type(
+    annotation = parse_operation_field_type(
         type_=type_,
         nullable=nullable,
         context=context,
         class_name="TestQueryField",
+        add_type_name=False,
     )
 
     assert compare_ast(annotation, expected_annotation)
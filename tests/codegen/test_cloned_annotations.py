@@ -0,0 +1,46 @@
+import ast
+
+from ariadne_codegen.client_generators.constants import (
+    ANNOTATED,
+    FIELD_CLASS,
+    LIST,
+    OPTIONAL,
+)
+from ariadne_codegen.codegen import clone_annotation
+
+from ..utils import compare_ast
+
+
+def test_clone_annotation_returns_equal_annotation_with_new_nodes():
+    annotation = ast.Subscript(
+        value=ast.Name(id=OPTIONAL),
+        slice=ast.Subscript(
+            value=ast.Name(id=LIST),
+            slice=ast.Tuple(elts=[ast.Name(id='"TypeA"'), ast.Name(id='"TypeB"')]),
+        ),
+    )
+
+    result = clone_annotation(annotation)
+
+    assert compare_ast(result, annotation)
+    assert result is not annotation
+    assert isinstance(result, ast.Subscript)
+    assert result.slice is not annotation.slice
+    assert isinstance(result.slice, ast.Subscript)
+    assert isinstance(result.slice.slice, ast.Tuple)
+    assert result.slice.slice.elts[0] is not annotation.slice.slice.elts[0]
+
+
+def test_clone_annotation_copies_other_nodes():
+    call = ast.Call(func=ast.Name(id=FIELD_CLASS), args=[], keywords=[])
+    annotation = ast.Subscript(
+        value=ast.Name(id=ANNOTATED),
+        slice=ast.Tuple(elts=[ast.Name(id="str"), call]),
+    )
+
+    result = clone_annotation(annotation)
+
+    assert compare_ast(result, annotation)
+    assert isinstance(result, ast.Subscript)
+    assert isinstance(result.slice, ast.Tuple)
+    assert result.slice.elts[1] is not call